@@ -0,0 +1,326 @@
+import os
+import sys
+from functools import reduce
+from multiprocessing import Pool
+
+import numpy as np
+
+N = 100             # dial size
+START = 50          # starting position
+CHUNK_BYTES = 1 << 22  # ~4 MiB of log text per chunk
+BATCH_CELLS = 1 << 22  # instructions x dials evaluated per block
+
+VALID_BYTES = b"LR0123456789 \t\r\n"
+
+# Byte classes for checking line shape
+IS_DIRECTION = np.zeros(256, dtype=bool)
+IS_DIRECTION[[ord("L"), ord("R")]] = True
+IS_DIGIT = np.zeros(256, dtype=bool)
+IS_DIGIT[ord("0"):ord("9") + 1] = True
+
+
+def check_lines(chunk: bytes):
+    """
+    Raise ValueError unless every non-blank line of the chunk is a single
+    L<n> or R<n> token. Only the allowed characters may appear (checked
+    by the caller).
+    """
+    b = np.frombuffer(chunk, dtype=np.uint8)
+    direction = IS_DIRECTION[b]
+    digit = IS_DIGIT[b]
+    # Whitespace before each byte; the chunk starts at a line start
+    space_before = np.empty(len(b), dtype=bool)
+    space_before[:1] = True
+    space_before[1:] = ~(direction[:-1] | digit[:-1])
+
+    if (
+        # A direction starts a token and is followed by a digit
+        (direction & ~space_before).any()
+        or direction[-1:].any()
+        or (direction[:-1] & ~digit[1:]).any()
+        # A digit continues a token; it never starts one
+        or (digit & space_before).any()
+    ):
+        raise ValueError("Malformed line in rotation log")
+
+    # At most one token per line: consecutive tokens sit on different lines
+    token_lines = np.searchsorted(np.flatnonzero(b == ord("\n")),
+                                  np.flatnonzero(direction))
+    if (np.diff(token_lines) == 0).any():
+        raise ValueError("Malformed line in rotation log")
+
+
+def parse_steps(chunk: bytes) -> np.ndarray:
+    """
+    Parse a block of rotation lines into signed steps:
+    R<n> -> +n, L<n> -> -n.
+    """
+    # Anything other than directions, digits and whitespace is bad input
+    if chunk.translate(None, VALID_BYTES):
+        raise ValueError("Invalid character in rotation log")
+    check_lines(chunk)
+
+    text = chunk.replace(b"R", b"").replace(b"L", b"-")
+    if not text.strip():
+        # fromstring reads a blank chunk as a single 0
+        return np.zeros(0, dtype=np.int64)
+    return np.fromstring(text, dtype=np.int64, sep=" ")
+
+
+def iter_step_chunks(path, chunk_bytes=CHUNK_BYTES, start=0, end=None):
+    """
+    Yield signed step arrays for newline-aligned chunks of the file,
+    limited to the byte range [start, end) when given.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        while end is None or pos < end:
+            size = chunk_bytes if end is None else min(chunk_bytes, end - pos)
+            chunk = f.read(size)
+            if not chunk:
+                return
+            # Finish the line we stopped in the middle of
+            if not chunk.endswith(b"\n"):
+                chunk += f.readline()
+            pos += len(chunk)
+            yield parse_steps(chunk)
+
+
+def positions_after(steps, pos, size=N):
+    """Dial position after each step, starting from pos."""
+    return (pos + np.cumsum(steps % size)) % size
+
+
+def instruction_hits(steps, pos, size=N):
+    """
+    Zero hits of each instruction in a chunk starting at pos.
+    Returns (hits, positions_after).
+    """
+    after = positions_after(steps, pos, size)
+    before = np.empty_like(after)
+    if len(steps):
+        before[0] = pos
+        before[1:] = after[:-1]
+
+    # Moving left from p hits 0 like moving right from (size - p) % size
+    offset = np.where(steps >= 0, before, (size - before) % size)
+    return (offset + np.abs(steps)) // size, after
+
+
+def chunk_zero_hits(steps, pos, size=N):
+    """
+    Count zero hits for one chunk of steps starting at pos.
+    Returns (zero_hits, final_pos).
+    """
+    if len(steps) == 0:
+        return 0, pos
+
+    hits, after = instruction_hits(steps, pos, size)
+    return int(hits.sum()), int(after[-1])
+
+
+def count_zero_landings(chunks, size=N, start=START):
+    """Part 1: count instructions that leave the dial on 0."""
+    pos = start
+    zero_count = 0
+
+    for steps in chunks:
+        if len(steps) == 0:
+            continue
+        after = positions_after(steps, pos, size)
+        zero_count += int(np.count_nonzero(after == 0))
+        pos = int(after[-1])
+
+    return zero_count
+
+
+def count_zero_hits(chunks, size=N, start=START):
+    """Part 2: count every click that passes through or lands on 0."""
+    pos = start
+    zero_hits = 0
+
+    for steps in chunks:
+        hits, pos = chunk_zero_hits(steps, pos, size)
+        zero_hits += hits
+
+    return zero_hits
+
+
+# ---------- Block summaries (for parallel reduction) ----------
+#
+# A block of instructions is summarized as (offset, table):
+#   offset   = net rotation of the block mod N
+#   table[p] = zero hits while running the block from position p
+# Summaries combine associatively, so shards can be reduced in any
+# grouping as long as their order is kept.
+
+def identity(size=N):
+    return 0, np.zeros(size, dtype=np.int64)
+
+
+def summarize(steps, size=N):
+    """Build the (offset, table) summary of a block of signed steps."""
+    if len(steps) == 0:
+        return identity(size)
+
+    signed = steps % size
+    amounts = np.abs(steps)
+    full_turns = int((amounts // size).sum())
+    rest = amounts % size
+
+    # Offset from the block's start position before each instruction
+    before = np.empty_like(signed)
+    before[0] = 0
+    np.cumsum(signed[:-1], out=before[1:])
+    before %= size
+
+    # Starting at p, instruction i begins at q = (p + before[i]) % size
+    # and makes one extra hit when
+    #   R: q >= size - rest   (q in [size - rest, size - 1])
+    #   L: 1 <= q <= rest
+    # Each case is a cyclic window of `rest` starting positions.
+    partial = rest > 0
+    low = np.where(steps > 0, size - rest, 1)
+    lo = ((low - before) % size)[partial]
+    hi = lo + rest[partial]
+
+    # Difference array over two laps, folded back onto one
+    diff = (np.bincount(lo, minlength=2 * size + 1)
+            - np.bincount(hi, minlength=2 * size + 1))
+    laps = np.cumsum(diff[:2 * size])
+    table = laps[:size] + laps[size:] + full_turns
+
+    return int(signed.sum() % size), table
+
+
+def combine(first, second, size=N):
+    """Summary of running `first` and then `second`."""
+    off_a, table_a = first
+    off_b, table_b = second
+    # After `first`, position p has moved to (p + off_a) % size
+    return (off_a + off_b) % size, table_a + np.roll(table_b, -off_a)
+
+
+def summarize_range(path, start, end, size=N):
+    """Summary of the instructions in bytes [start, end) of the file."""
+    summary = identity(size)
+    for steps in iter_step_chunks(path, start=start, end=end):
+        summary = combine(summary, summarize(steps, size), size)
+    return summary
+
+
+def shard_bounds(path, shards):
+    """Split the file into at most `shards` newline-aligned byte ranges."""
+    total = os.path.getsize(path)
+    cuts = [0]
+    with open(path, "rb") as f:
+        for k in range(1, shards):
+            f.seek(max(total * k // shards, cuts[-1]))
+            if f.tell() > 0:
+                f.seek(f.tell() - 1)
+                f.readline()  # move to the start of the next line
+            cuts.append(f.tell())
+    cuts.append(total)
+    return [(a, b) for a, b in zip(cuts, cuts[1:]) if a < b]
+
+
+def _summarize_shard(args):
+    return summarize_range(*args)
+
+
+def count_zero_hits_parallel(path, workers=None, size=N, start=START):
+    """Part 2 on a process pool: summarize shards, then combine in order."""
+    workers = workers or os.cpu_count() or 1
+    jobs = [(path, a, b, size) for a, b in shard_bounds(path, workers)]
+
+    with Pool(workers) as pool:
+        summaries = pool.map(_summarize_shard, jobs)
+
+    _, table = reduce(lambda a, b: combine(a, b, size),
+                      summaries, identity(size))
+    return int(table[start])
+
+
+# ---------- Prefix index (O(1) range queries) ----------
+#
+# positions[i] = dial position before instruction i
+# prefix[i]    = zero hits made by instructions [0, i)
+# Both arrays have one entry per instruction plus one.
+
+def build_index(chunks, size=N, start=START):
+    """Build (positions, prefix) over the whole log in one pass."""
+    positions = [np.array([start], dtype=np.int64)]
+    hit_counts = [np.zeros(1, dtype=np.int64)]
+    pos = start
+
+    for steps in chunks:
+        if len(steps) == 0:
+            continue
+        hits, after = instruction_hits(steps, pos, size)
+        positions.append(after)
+        hit_counts.append(hits)
+        pos = int(after[-1])
+
+    positions = np.concatenate(positions).astype(np.min_scalar_type(size - 1))
+    prefix = np.cumsum(np.concatenate(hit_counts))
+    return positions, prefix
+
+
+def save_index(path, positions, prefix):
+    np.savez(path, positions=positions, prefix=prefix)
+
+
+def load_index(path):
+    with np.load(path) as data:
+        return data["positions"], data["prefix"]
+
+
+def range_zero_hits(prefix, i, j):
+    """Zero hits made by instructions [i, j), run from their true start."""
+    return int(prefix[j] - prefix[i])
+
+
+# ---------- Batch simulation (many dials, one stream) ----------
+
+def simulate_batch(chunks, sizes, starts):
+    """
+    Run one instruction stream against many dial configurations at once.
+    sizes and starts broadcast against each other; returns
+    (zero_landings, zero_hits) arrays with one entry per configuration.
+    """
+    sizes, starts = np.broadcast_arrays(np.asarray(sizes, dtype=np.int64),
+                                        np.asarray(starts, dtype=np.int64))
+    sizes = sizes.ravel()
+    pos = starts.ravel() % sizes
+
+    landings = np.zeros(len(sizes), dtype=np.int64)
+    hits = np.zeros(len(sizes), dtype=np.int64)
+    # Keep each (instructions x dials) block bounded
+    rows = max(1, BATCH_CELLS // max(1, len(sizes)))
+
+    for steps in chunks:
+        for lo in range(0, len(steps), rows):
+            block = steps[lo:lo + rows, None]
+
+            after = (pos + np.cumsum(block % sizes, axis=0)) % sizes
+            before = np.vstack([pos, after[:-1]])
+            offset = np.where(block >= 0, before, (sizes - before) % sizes)
+
+            hits += ((offset + np.abs(block)) // sizes).sum(axis=0)
+            landings += np.count_nonzero(after == 0, axis=0)
+            pos = after[-1]
+
+    return landings, hits
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "day1/day1-input.txt"
+    print(count_zero_landings(iter_step_chunks(path)))
+    print(count_zero_hits(iter_step_chunks(path)))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 day1/dial.py [day1/day1-input.txt]
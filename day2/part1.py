@@ -55,18 +55,16 @@ def sum_invalid_ids(line: str) -> int:
             if base_min > base_max:
                 continue
 
-            # Now generate all invalid IDs in this length/range
-            pow10_half = 10 ** half_len
-            for base in range(base_min, base_max + 1):
-                n = base * pow10_half + base
-                total_sum += n
+            # Sum of base * factor over base_min..base_max (arithmetic series)
+            count = base_max - base_min + 1
+            total_sum += factor * (base_min + base_max) * count // 2
 
     return total_sum
 
 
 def main():
-    line = sys.stdin.readline()
-    result = sum_invalid_ids(line)
+    # Each line is its own list of ranges; blank lines contribute 0
+    result = sum(sum_invalid_ids(line) for line in sys.stdin)
     print(result)
 
 
@@ -20,6 +20,60 @@ def is_invalid_id(n: int) -> bool:
     return False
 
 
+def mobius(n: int) -> int:
+    """Möbius function: 0 if n has a squared prime factor, else (-1)^k."""
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    if n > 1:
+        result = -result
+    return result
+
+
+def sum_repeated(L: int, d: int, low: int, high: int) -> int:
+    """
+    Sum of the L-digit numbers in [low, high] made by repeating a
+    d-digit block (no leading zero) L // d times.
+    """
+    # n = block * factor, factor = 1 followed by (d-1 zeros, 1) repeated
+    factor = (10 ** L - 1) // (10 ** d - 1)
+
+    block_min = max((low + factor - 1) // factor, 10 ** (d - 1))
+    block_max = min(high // factor, 10 ** d - 1)
+
+    if block_min > block_max:
+        return 0
+
+    count = block_max - block_min + 1
+    return factor * (block_min + block_max) * count // 2
+
+
+def sum_invalid_in_range(start: int, end: int) -> int:
+    total = 0
+
+    for L in range(len(str(start)), len(str(end)) + 1):
+        length_low = max(start, 10 ** (L - 1))
+        length_high = min(end, 10 ** L - 1)
+
+        if length_low > length_high:
+            continue
+
+        # sum_repeated(L, d) also counts numbers whose period divides d.
+        # Inclusion-exclusion over proper divisors counts each once:
+        #   union = -sum over d | L, d < L of mobius(L / d) * sum_repeated(d)
+        for d in range(1, L):
+            if L % d == 0:
+                total -= mobius(L // d) * sum_repeated(L, d, length_low, length_high)
+
+    return total
+
+
 def sum_invalid_ids(line: str) -> int:
     total = 0
     line = line.strip()
@@ -35,9 +89,7 @@ def sum_invalid_ids(line: str) -> int:
         if start > end:
             start, end = end, start
 
-        for n in range(start, end + 1):
-            if is_invalid_id(n):
-                total += n
+        total += sum_invalid_in_range(start, end)
 
     return total
 
@@ -0,0 +1,136 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from part1 import sum_invalid_ids as sum_twice_ids
+from part2 import sum_invalid_in_range as sum_repeated_ids
+
+DIGITS = 12  # default digit limit for the precomputed tables
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Table layout (int64, shape (2, M + 1)), both rows contiguous:
+#   table[0] = [0, id_1, id_2, ..., id_M]          sorted invalid IDs
+#   table[1] = [0, id_1, id_1 + id_2, ..., total]  prefix sums
+# The leading 0 column means a range query is two bisects and a subtraction.
+
+
+def blocks(d: int) -> np.ndarray:
+    """Every d-digit block without a leading zero."""
+    return np.arange(10 ** (d - 1), 10 ** d, dtype=np.int64)
+
+
+def repeated(L: int, d: int) -> np.ndarray:
+    """L-digit numbers made by repeating a d-digit block, in order."""
+    factor = (10 ** L - 1) // (10 ** d - 1)
+    return blocks(d) * factor
+
+
+def twice_ids(L: int) -> np.ndarray:
+    """Part 1 rule: a block repeated exactly twice."""
+    if L % 2:
+        return np.zeros(0, dtype=np.int64)
+    return repeated(L, L // 2)
+
+
+def at_least_twice_ids(L: int) -> np.ndarray:
+    """Part 2 rule: a block repeated two or more times."""
+    parts = [repeated(L, d) for d in range(1, L) if L % d == 0]
+    if not parts:
+        return np.zeros(0, dtype=np.int64)
+    # A number with several periods appears once per period
+    return np.unique(np.concatenate(parts))
+
+
+RULES = {
+    "part1": (twice_ids, lambda high: sum_twice_ids(f"1-{high}")),
+    "part2": (at_least_twice_ids, lambda high: sum_repeated_ids(1, high)),
+}
+
+
+def build_table(rule: str, digits: int = DIGITS) -> np.ndarray:
+    ids_for_length, closed_form_total = RULES[rule]
+
+    # The last prefix sum must fit in int64
+    if closed_form_total(10 ** digits - 1) > np.iinfo(np.int64).max:
+        raise OverflowError(f"{rule} table with {digits} digits overflows int64")
+
+    # Lengths are disjoint and increasing, so concatenation stays sorted
+    ids = np.concatenate([np.zeros(1, dtype=np.int64)]
+                         + [ids_for_length(L) for L in range(1, digits + 1)])
+    return np.stack([ids, np.cumsum(ids)])
+
+
+def table_path(rule: str, digits: int = DIGITS, table_dir: str = TABLE_DIR) -> str:
+    return os.path.join(table_dir, f"invalid-ids-{rule}-{digits}.npy")
+
+
+def save_table(path, table: np.ndarray):
+    """
+    Write a table atomically: save to a temporary file in the same
+    directory, then rename it into place, so a reader never maps a
+    half-written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, table)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_table(rule: str, digits: int = DIGITS, table_dir: str = TABLE_DIR) -> np.ndarray:
+    """Memory-map a saved table, building and saving it first if needed."""
+    path = table_path(rule, digits, table_dir)
+    if not os.path.exists(path):
+        save_table(path, build_table(rule, digits))
+    return np.load(path, mmap_mode="r")
+
+
+def range_sum(table: np.ndarray, start: int, end: int, digits: int = DIGITS) -> int:
+    """Sum of the table's invalid IDs in [start, end]."""
+    if start > end:
+        start, end = end, start
+    if end >= 10 ** digits:
+        raise ValueError(f"Range end {end} has more than {digits} digits")
+
+    ids, prefix = table[0], table[1]
+    lo = int(np.searchsorted(ids, max(start, 1), side="left"))
+    hi = int(np.searchsorted(ids, end, side="right"))
+    if hi <= lo:
+        return 0
+    return int(prefix[hi - 1]) - int(prefix[lo - 1])
+
+
+def sum_line(table: np.ndarray, line: str, digits: int = DIGITS) -> int:
+    total = 0
+    for part in line.strip().split(','):
+        part = part.strip()
+        if not part:
+            continue
+        start_str, end_str = part.split('-')
+        total += range_sum(table, int(start_str), int(end_str), digits)
+    return total
+
+
+def main():
+    digits = int(sys.argv[1]) if len(sys.argv) > 1 else DIGITS
+    table_dir = sys.argv[2] if len(sys.argv) > 2 else TABLE_DIR
+    tables = [load_table(rule, digits, table_dir) for rule in RULES]
+
+    totals = [0] * len(tables)
+    for line in sys.stdin:
+        for k, table in enumerate(tables):
+            totals[k] += sum_line(table, line, digits)
+
+    for total in totals:
+        print(total)
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 table.py [digits] [table_dir] < day2-input.txt
@@ -0,0 +1,93 @@
+from array import array
+
+INT_STR_DIGITS = 4000  # int() refuses digit strings over 4300 long
+
+
+def digits_value(digits: str) -> int:
+    """
+    int(digits) for a digit string of any length. Long strings are split
+    in half and the halves recombined, so no single int() call goes over
+    the conversion limit.
+    """
+    if len(digits) <= INT_STR_DIGITS:
+        return int(digits)
+    mid = len(digits) // 2
+    low = digits[mid:]
+    return digits_value(digits[:mid]) * 10 ** len(low) + digits_value(low)
+
+
+def best_k_digit(bank: str, k: int) -> int:
+    """
+    Largest number formed by keeping exactly k digits of the bank,
+    in their original order.
+
+    Monotonic stack: a digit is dropped whenever a larger one arrives
+    after it and we can still afford to drop (n - k drops in total).
+    Every digit is pushed and popped at most once, so this is O(n).
+    """
+    bank = bank.strip()
+    n = len(bank)
+    if not 0 < k <= n:
+        raise ValueError(f"Cannot pick {k} digits from a bank of {n}")
+
+    drops = n - k
+    stack = []
+
+    for d in bank:
+        while drops and stack and stack[-1] < d:
+            stack.pop()
+            drops -= 1
+        stack.append(d)
+
+    # Leftover drops come off the (non-increasing) tail
+    return digits_value("".join(stack[:k]))
+
+
+def removal_order(bank: str) -> array:
+    """
+    Indices of the bank's digits in the order greedy deletion removes them.
+
+    Deleting the first digit that is smaller than its right neighbour (or
+    the last digit if there is none) gives the best (n - 1)-digit number,
+    and repeating it gives the best number for every smaller k. The
+    monotonic stack pops digits in exactly that order, then the leftover
+    non-increasing stack is removed from its tail. O(n) overall.
+    """
+    bank = bank.strip()
+    order = array("I")
+    stack = []
+
+    for i, d in enumerate(bank):
+        while stack and bank[stack[-1]] < d:
+            order.append(stack.pop())
+        stack.append(i)
+
+    order.extend(reversed(stack))
+    return order
+
+
+def keep_ranks(bank: str) -> array:
+    """
+    Compact all-k answer: digit i is part of the best k-digit number
+    exactly when ranks[i] < k.
+    """
+    order = removal_order(bank)
+    n = len(order)
+    ranks = array("I", [0]) * n
+    for step, i in enumerate(order):
+        ranks[i] = n - 1 - step
+    return ranks
+
+
+def iter_best_all_k(bank: str):
+    """
+    Yield (k, digits of the best k-digit number) for k = 1 .. len(bank).
+    Answers are digit strings, since long ones are past what int() and
+    str() convert (digits_value turns one into an int when needed).
+    """
+    bank = bank.strip()
+    ranks = keep_ranks(bank)
+
+    # Each answer is built from the ranks in O(n); only one is alive at a time
+    for k in range(1, len(bank) + 1):
+        yield k, "".join(d for d, r in zip(bank, ranks) if r < k)
@@ -0,0 +1,85 @@
+import mmap
+import os
+import sys
+from multiprocessing import Pool
+
+ZERO = ord("0")
+CHUNK_BYTES = 1 << 22  # ~4 MiB of bank text per job
+
+
+def best_k_digit_bytes(bank: bytes, k: int) -> int:
+    """
+    best_k_digit for a raw bytes bank.
+
+    Greedy window scan where each window's max and its position come from
+    the C-level bytes max()/index(), so no per-digit Python objects are
+    built. Cheapest for the small k used by the puzzle parts.
+    """
+    n = len(bank)
+    if not 0 < k <= n:
+        raise ValueError(f"Cannot pick {k} digits from a bank of {n}")
+
+    value = 0
+    start = 0
+    for remaining in range(k, 0, -1):
+        # The next digit must leave room for the remaining - 1 after it
+        window = bank[start:n - remaining + 1]
+        best = max(window)
+        start += window.index(best) + 1
+        value = value * 10 + best - ZERO
+    return value
+
+
+def bank_score(bank: bytes, k: int) -> int:
+    # A bank with fewer than k digits has nothing to pick (as in part1)
+    if len(bank) < k:
+        return 0
+    return best_k_digit_bytes(bank, k)
+
+
+def chunk_bounds(mm, chunk_bytes=CHUNK_BYTES):
+    """Yield newline-aligned ranges of about chunk_bytes covering the file."""
+    total = len(mm)
+    start = 0
+    while start < total:
+        cut = mm.find(b"\n", min(start + chunk_bytes, total) - 1)
+        end = total if cut < 0 else cut + 1
+        yield start, end
+        start = end
+
+
+def sum_chunk(args):
+    """Sum of best k-digit numbers over the banks in bytes [start, end)."""
+    path, start, end, k = args
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Only this chunk is copied out of the mapping
+        return sum(bank_score(bank, k) for bank in mm[start:end].split())
+
+
+def sum_file(path, k, workers=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Memory-map the bank file and sum it in fixed-size chunks on a process
+    pool, so each worker holds one chunk at a time whatever the file size.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            jobs = [(path, a, b, k) for a, b in chunk_bounds(mm, chunk_bytes)]
+
+    with Pool(workers) as pool:
+        return sum(pool.imap_unordered(sum_chunk, jobs))
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "day3-input.txt"
+    print(sum_file(path, 2))
+    print(sum_file(path, 12))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 batch.py [day3-input.txt]
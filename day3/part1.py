@@ -1,16 +1,12 @@
 import sys
 
-def best_two_digit(bank: str) -> int:
-    digits = [int(c) for c in bank.strip()]
-    n = len(digits)
+from bank import best_k_digit
 
-    best = 0
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            value = digits[i] * 10 + digits[j]
-            if value > best:
-                best = value
-    return best
+def best_two_digit(bank: str) -> int:
+    # A bank with fewer than two digits has no pair to pick
+    if len(bank.strip()) < 2:
+        return 0
+    return best_k_digit(bank, 2)
 
 
 def main():
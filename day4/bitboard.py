@@ -0,0 +1,95 @@
+import sys
+
+# Byte translation: '@' -> '1', every other byte -> '0'
+ROLL_BITS = bytes(b"1"[0] if b == ord("@") else b"0"[0] for b in range(256))
+
+
+def to_bitboard(lines):
+    """
+    Pack grid rows (str or bytes) into ints: bit c of a row is set when
+    column c holds a roll. Returns (rows, width).
+    """
+    lines = [line.encode() if isinstance(line, str) else line for line in lines]
+    width = max((len(line) for line in lines), default=0)
+
+    rows = []
+    for line in lines:
+        # Reverse so column 0 lands on the lowest bit
+        bits = line[::-1].translate(ROLL_BITS)
+        rows.append(int(bits, 2) if bits else 0)
+    return rows, width
+
+
+def full_add(a, b, c):
+    """Bitwise full adder: returns (sum, carry) for every bit at once."""
+    ab = a ^ b
+    return ab ^ c, (a & b) | (c & ab)
+
+
+def fewer_than_four(neighbors):
+    """
+    Bit-sliced test of "fewer than 4 of these 8 masks are set" per bit.
+    """
+    a, b, c, d, e, f, g, h = neighbors
+
+    # Weight-1 column: three adders reduce 8 inputs to one sum bit
+    s1, c1 = full_add(a, b, c)
+    s2, c2 = full_add(d, e, f)
+    s3, c3 = g ^ h, g & h
+    _, c4 = full_add(s1, s2, s3)
+
+    # count = ones + 2 * (c1 + c2 + c3 + c4), and ones <= 1,
+    # so count < 4 exactly when at most one carry is set
+    t0, t1 = full_add(c1, c2, c3)
+    return ~(t1 | (t0 & c4))
+
+
+def accessible_rows(rows, width):
+    """Per-row masks of rolls with fewer than 4 neighboring rolls."""
+    full = (1 << width) - 1
+    result = []
+
+    for r, row in enumerate(rows):
+        up = rows[r - 1] if r > 0 else 0
+        down = rows[r + 1] if r + 1 < len(rows) else 0
+
+        neighbors = (
+            (up << 1) & full, up, up >> 1,
+            (row << 1) & full, row >> 1,
+            (down << 1) & full, down, down >> 1,
+        )
+        result.append(row & fewer_than_four(neighbors))
+
+    return result
+
+
+def count_accessible_rolls(rows, width):
+    return sum(mask.bit_count() for mask in accessible_rows(rows, width))
+
+
+def count_removed_rolls(rows, width):
+    """Part 2 on the bitboard: remove accessible rolls round by round."""
+    total_removed = 0
+
+    while True:
+        masks = accessible_rows(rows, width)
+        removed = sum(mask.bit_count() for mask in masks)
+        if removed == 0:
+            return total_removed
+
+        # Remove all accessible rolls simultaneously
+        rows = [row & ~mask for row, mask in zip(rows, masks)]
+        total_removed += removed
+
+
+def main():
+    lines = [line.rstrip(b"\r\n") for line in sys.stdin.buffer if line.strip()]
+    rows, width = to_bitboard(lines)
+    print(count_accessible_rolls(rows, width))
+    print(count_removed_rolls(rows, width))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 bitboard.py < day4-input.txt
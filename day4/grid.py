@@ -0,0 +1,64 @@
+import sys
+
+import numpy as np
+
+ROLL = ord("@")
+NEWLINE = ord("\n")
+
+
+def load_grid(grid_text) -> np.ndarray:
+    """Parse the grid (str or bytes) into a uint8 occupancy array, 1 = roll."""
+    data = grid_text.encode() if isinstance(grid_text, str) else grid_text
+    data = data.strip()
+    if not data:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    width = data.find(b"\n")
+    width = len(data) if width < 0 else width
+    rows = (len(data) + 1) // (width + 1)
+
+    # Fast path: equal-width rows can be viewed in place as a matrix
+    if rows * (width + 1) == len(data) + 1:
+        raw = np.frombuffer(data + b"\n", dtype=np.uint8).reshape(rows, width + 1)
+        if (raw[:, width] == NEWLINE).all():
+            return (raw[:, :width] == ROLL).view(np.uint8)
+
+    # Ragged rows: pad short rows with empty cells
+    lines = data.splitlines()
+    occ = np.zeros((len(lines), max(len(line) for line in lines)), dtype=np.uint8)
+    for r, line in enumerate(lines):
+        row = np.frombuffer(line, dtype=np.uint8)
+        occ[r, :len(row)] = row == ROLL
+    return occ
+
+
+def neighbor_counts(occ: np.ndarray) -> np.ndarray:
+    """Number of occupied cells among the 8 neighbors of every cell."""
+    # 3x3 box sum done separably: horizontal 3-sum, then vertical 3-sum
+    horiz = occ.copy()
+    horiz[:, 1:] += occ[:, :-1]
+    horiz[:, :-1] += occ[:, 1:]
+
+    box = horiz.copy()
+    box[1:, :] += horiz[:-1, :]
+    box[:-1, :] += horiz[1:, :]
+
+    # The box includes the cell itself
+    box -= occ
+    return box
+
+
+def accessible_mask(occ: np.ndarray) -> np.ndarray:
+    """Rolls with fewer than 4 neighboring rolls."""
+    return (occ == 1) & (neighbor_counts(occ) < 4)
+
+
+def count_accessible_rolls(grid_text) -> int:
+    occ = load_grid(grid_text)
+    return int(np.count_nonzero(accessible_mask(occ)))
+
+
+if __name__ == "__main__":
+    print(count_accessible_rolls(sys.stdin.buffer.read()))
+
+# To run: python3 grid.py < day4-input.txt
@@ -4,45 +4,55 @@ def count_removed_rolls(grid):
     rows = len(grid)
     cols = len(grid[0]) if rows else 0
 
-    # 8-direction adjacency
+    # Flat grid with a one-cell empty border, so neighbors never fall
+    # outside the array and no bounds checks are needed
+    width = cols + 2
+    present = bytearray(width * (rows + 2))
+    for r, row in enumerate(grid):
+        base = (r + 1) * width + 1
+        for c, ch in enumerate(row[:cols]):
+            if ch == '@':
+                present[base + c] = 1
+
+    # 8-direction adjacency as flat offsets
     directions = [
-        (-1,  0), (-1,  1), ( 0, 1), ( 1, 1),
-        ( 1,  0), ( 1, -1), ( 0, -1), (-1, -1)
+        -width - 1, -width, -width + 1,
+        -1,                  1,
+        width - 1,  width,  width + 1,
     ]
 
-    total_removed = 0
-
-    # Convert grid to a mutable structure
-    grid = [list(row) for row in grid]
-
-    while True:
-        to_remove = []
-
-        # Step 1: Compute adjacency for all rolls
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] != '@':
-                    continue
+    # Step 1: Compute adjacency once for all rolls
+    counts = bytearray(len(present))
+    rolls = [i for i, v in enumerate(present) if v]
+    for i in rolls:
+        counts[i] = sum(present[i + d] for d in directions)
 
-                neighbor_count = 0
-                for dr, dc in directions:
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_count += 1
+    frontier = [i for i in rolls if counts[i] < 4]
+    queued = bytearray(len(present))
+    for i in frontier:
+        queued[i] = 1
 
-                if neighbor_count < 4:
-                    to_remove.append((r, c))
-
-        # Step 2: Stop if nothing to remove
-        if not to_remove:
-            break
-
-        # Step 3: Remove all accessible rolls simultaneously
-        for r, c in to_remove:
-            grid[r][c] = '.'
+    total_removed = 0
 
-        total_removed += len(to_remove)
+    while frontier:
+        # Step 2: Remove this round's accessible rolls simultaneously
+        for i in frontier:
+            present[i] = 0
+        total_removed += len(frontier)
+
+        # Step 3: Only neighbors of removed rolls can become accessible;
+        # they are exactly the ones removed in the next round
+        next_frontier = []
+        for i in frontier:
+            for d in directions:
+                j = i + d
+                if present[j]:
+                    counts[j] -= 1
+                    if counts[j] < 4 and not queued[j]:
+                        queued[j] = 1
+                        next_frontier.append(j)
+
+        frontier = next_frontier
 
     return total_removed
 
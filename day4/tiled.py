@@ -0,0 +1,155 @@
+import mmap
+import os
+import sys
+import tempfile
+from collections import deque
+
+import numpy as np
+
+from grid import NEWLINE, ROLL, accessible_mask
+
+BAND_ROWS = 1024  # grid rows processed per band (plus a one-row halo)
+COUNT_BYTES = 1 << 22  # ~4 MiB of the map copied per newline count
+
+
+def count_newlines(mm, end) -> int:
+    """Newlines in mm[:end], counted in bounded slices of the mapping."""
+    return sum(mm[pos:min(pos + COUNT_BYTES, end)].count(b"\n")
+               for pos in range(0, end, COUNT_BYTES))
+
+
+def map_grid(f):
+    """
+    Memory-map an equal-width grid file and view it as a (rows, width)
+    uint8 matrix without copying. The view keeps the mapping alive.
+    Raises ValueError for ragged rows, which cannot be viewed in place
+    (grid.load_grid pads them in memory instead).
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    width = mm.find(b"\n")
+    if width < 0:
+        width = len(mm)  # single row, no newline
+    stride = width + 1
+
+    # Trailing newlines end the grid; the last row may lack its own
+    size = len(mm)
+    while size and mm[size - 1] == NEWLINE:
+        size -= 1
+    if size == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    # Equal-width rows: the size fits, every row ends in a newline at
+    # column width, and there are no other newlines
+    rows = (size + 1) // stride
+    if width == 0:
+        raise ValueError("Grid rows must all have the same width")
+    ends = np.ndarray((rows - 1,), dtype=np.uint8, buffer=mm,
+                      offset=width, strides=(stride,))
+    if (rows * stride != size + 1
+            or not (ends == NEWLINE).all()
+            or count_newlines(mm, size) != rows - 1):
+        raise ValueError("Grid rows must all have the same width")
+
+    view = np.ndarray((rows, width), dtype=np.uint8, buffer=mm, strides=(stride, 1))
+    return view
+
+
+def bands(rows, band_rows):
+    """Yield (start, end, lo, hi): band [start, end) with halo [lo, hi)."""
+    for start in range(0, rows, band_rows):
+        end = min(start + band_rows, rows)
+        yield start, end, max(start - 1, 0), min(end + 1, rows)
+
+
+def iter_accessible_counts(path, band_rows=BAND_ROWS):
+    """Part 1, streamed: accessible roll count for each band of rows."""
+    with open(path, "rb") as f:
+        view = map_grid(f)
+        for start, end, lo, hi in bands(len(view), band_rows):
+            occ = (view[lo:hi] == ROLL).view(np.uint8)
+            mask = accessible_mask(occ)
+            yield int(np.count_nonzero(mask[start - lo:end - lo]))
+
+
+def peel_band(occ, start, end):
+    """
+    Remove accessible rolls in rows [start, end) of a band (halo rows are
+    read but never changed) until none are left. Returns the count removed.
+    """
+    removed = 0
+    while True:
+        mask = accessible_mask(occ)
+        mask[:start] = False
+        mask[end:] = False
+        n = int(np.count_nonzero(mask))
+        if n == 0:
+            return removed
+        occ[mask] = 0
+        removed += n
+
+
+def count_removed_rolls(path, band_rows=BAND_ROWS):
+    """
+    Part 2 out of core. The working grid lives in a disk-backed memmap;
+    bands are peeled one at a time and written back. Peeling only ever
+    lowers neighbor counts, so any removal order ends at the same stable
+    grid.
+
+    A band is peeled again only when a neighbor changed the row it shares
+    as a halo, so a cascade moving up or down the grid visits each band
+    it reaches once instead of costing a full sweep per band.
+    """
+    with open(path, "rb") as f, tempfile.TemporaryFile() as scratch:
+        view = map_grid(f)
+        rows, width = view.shape
+        if rows == 0 or width == 0:
+            return 0
+
+        state = np.memmap(scratch, dtype=np.uint8, mode="w+", shape=(rows, width))
+        for start, end, _, _ in bands(rows, band_rows):
+            state[start:end] = view[start:end] == ROLL
+        del view
+
+        band_list = list(bands(rows, band_rows))
+        dirty = deque(range(len(band_list)))
+        queued = [True] * len(band_list)
+        total_removed = 0
+
+        while dirty:
+            b = dirty.popleft()
+            queued[b] = False
+            start, end, lo, hi = band_list[b]
+
+            occ = np.array(state[lo:hi])
+            top = occ[start - lo].copy()
+            bottom = occ[end - 1 - lo].copy()
+            n = peel_band(occ, start - lo, end - lo)
+            if n == 0:
+                continue
+            state[start:end] = occ[start - lo:end - lo]
+            total_removed += n
+
+            # Neighbors whose halo row changed have to be peeled again
+            for nb, changed in ((b - 1, (occ[start - lo] != top).any()),
+                                (b + 1, (occ[end - 1 - lo] != bottom).any())):
+                if changed and 0 <= nb < len(band_list) and not queued[nb]:
+                    queued[nb] = True
+                    dirty.append(nb)
+
+        return total_removed
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "day4-input.txt"
+    band_rows = int(sys.argv[2]) if len(sys.argv) > 2 else BAND_ROWS
+    print(sum(iter_accessible_counts(path, band_rows)))
+    print(count_removed_rolls(path, band_rows))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 tiled.py [day4-input.txt] [band_rows]
@@ -0,0 +1,162 @@
+import sys
+from bisect import bisect_left, bisect_right
+
+from part2 import merge_ranges
+
+LOAD = 512  # intervals per block; a block is split at twice this
+
+
+# ---------- Dynamic interval set ----------
+class IntervalSet:
+    """
+    Sorted, disjoint, non-adjacent inclusive integer ranges, with the
+    covered count kept up to date.
+
+    Intervals are stored as a blocked sorted list: parallel start/end
+    lists cut into blocks of at most 2 * LOAD, plus the last end of each
+    block. An insert finds its block and position by bisection, O(log n),
+    and only edits lists of one block and the short per-block index, so
+    it never shifts the whole set.
+    """
+
+    def __init__(self, ranges=()):
+        self._starts = []  # blocks of interval starts
+        self._ends = []    # matching blocks of interval ends
+        self._maxes = []   # last end in each block
+        self.covered = 0   # number of integers in the set (part 2 answer)
+        for start, end in ranges:
+            self.insert(start, end)
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """Bulk build: sort and merge once, O(n log n)."""
+        interval_set = cls()
+        merged = merge_ranges([(min(r), max(r)) for r in ranges])
+
+        for b in range(0, len(merged), LOAD):
+            block = merged[b:b + LOAD]
+            interval_set._starts.append([start for start, _ in block])
+            interval_set._ends.append([end for _, end in block])
+            interval_set._maxes.append(block[-1][1])
+
+        interval_set.covered = sum(end - start + 1 for start, end in merged)
+        return interval_set
+
+    def insert(self, start, end):
+        if start > end:
+            start, end = end, start
+
+        if not self._maxes:
+            self._starts.append([start])
+            self._ends.append([end])
+            self._maxes.append(end)
+            self.covered = end - start + 1
+            return
+
+        # First interval overlapping or adjacent to [start, end]: the first
+        # with end >= start - 1. Past every block, it goes last.
+        b = bisect_left(self._maxes, start - 1)
+        if b == len(self._maxes):
+            b -= 1
+            i = len(self._ends[b])
+        else:
+            i = bisect_left(self._ends[b], start - 1)
+
+        # Absorb the run of intervals with start <= end + 1; it may spill
+        # into the following blocks. Each interval is absorbed only once.
+        nb = b
+        while nb < len(self._starts):
+            starts, ends = self._starts[nb], self._ends[nb]
+            lo = i if nb == b else 0
+            hi = bisect_right(starts, end + 1)
+            if hi <= lo:
+                break
+
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+            for k in range(lo, hi):
+                self.covered -= ends[k] - starts[k] + 1
+            run_ends_here = hi < len(starts)
+            del starts[lo:hi]
+            del ends[lo:hi]
+
+            if run_ends_here:
+                break
+            nb += 1
+
+        # Blocks after b that the run swallowed whole are now empty (block b
+        # itself gets the merged interval back)
+        del self._starts[b + 1:nb], self._ends[b + 1:nb], self._maxes[b + 1:nb]
+
+        starts, ends = self._starts[b], self._ends[b]
+        starts.insert(i, start)
+        ends.insert(i, end)
+        self._maxes[b] = ends[-1]
+        self.covered += end - start + 1
+
+        if len(starts) > 2 * LOAD:
+            self._starts[b + 1:b + 1] = [starts[LOAD:]]
+            self._ends[b + 1:b + 1] = [ends[LOAD:]]
+            self._maxes[b + 1:b + 1] = [ends[-1]]
+            del starts[LOAD:], ends[LOAD:]
+            self._maxes[b] = ends[-1]
+
+    def __contains__(self, value):
+        # Only the first interval ending at or after value can hold it
+        b = bisect_left(self._maxes, value)
+        if b == len(self._maxes):
+            return False
+        i = bisect_left(self._ends[b], value)
+        return self._starts[b][i] <= value
+
+    def __iter__(self):
+        for starts, ends in zip(self._starts, self._ends):
+            yield from zip(starts, ends)
+
+    def __len__(self):
+        return sum(len(starts) for starts in self._starts)
+
+    def save(self, path):
+        """Write the set as "start-end" lines, the database range format."""
+        with open(path, "w") as f:
+            for start, end in self:
+                f.write(f"{start}-{end}\n")
+
+    @classmethod
+    def load(cls, path):
+        """Read "start-end" lines up to the first blank line."""
+        ranges = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line == "":
+                    break
+                ranges.append(tuple(map(int, line.split("-"))))
+        return cls.from_ranges(ranges)
+
+
+def main():
+    ranges = []
+    for line in sys.stdin:
+        line = line.strip()
+        if line == "":
+            break
+        ranges.append(tuple(map(int, line.split("-"))))
+
+    # The whole range section is known up front, so build it in bulk;
+    # insert() is there for ranges that arrive later
+    fresh = IntervalSet.from_ranges(ranges)
+
+    fresh_count = 0
+    for line in sys.stdin:
+        line = line.strip()
+        if line and int(line) in fresh:
+            fresh_count += 1
+
+    print(fresh_count)
+    print(fresh.covered)
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 intervals.py < day5-input.txt
@@ -1,9 +1,9 @@
 import sys
+from bisect import bisect_right
 
-def count_fresh_ids(input_text: str) -> int:
+def parse_database(input_text: str):
     """
-    Given full database input text, return the number of available
-    ingredient IDs that fall within at least one fresh range.
+    Split database input text into (fresh ranges, available IDs).
     """
 
     lines = [line.strip() for line in input_text.splitlines()]
@@ -23,11 +23,44 @@ def count_fresh_ids(input_text: str) -> int:
         else:
             available.append(int(line))
 
-    merged = merge_ranges(ranges)
+    return ranges, available
+
+
+def count_fresh_ids(input_text: str) -> int:
+    """
+    Given full database input text, return the number of available
+    ingredient IDs that fall within at least one fresh range.
+    """
+
+    ranges, available = parse_database(input_text)
+    starts, ends = build_lookup(merge_ranges(ranges))
 
     fresh_count = 0
     for ingredient_id in available:
-        if is_in_any_range(ingredient_id, merged):
+        if is_fresh(ingredient_id, starts, ends):
+            fresh_count += 1
+
+    return fresh_count
+
+
+def count_fresh_sweep(input_text: str) -> int:
+    """
+    Same answer as count_fresh_ids, but sorts the available IDs and walks
+    them alongside the merged ranges in a single pass.
+    """
+
+    ranges, available = parse_database(input_text)
+    merged = merge_ranges(ranges)
+
+    fresh_count = 0
+    i = 0
+    for ingredient_id in sorted(available):
+        # Skip ranges that end before this ID; later IDs are larger
+        while i < len(merged) and merged[i][1] < ingredient_id:
+            i += 1
+        if i == len(merged):
+            break
+        if merged[i][0] <= ingredient_id:
             fresh_count += 1
 
     return fresh_count
@@ -52,6 +85,22 @@ def merge_ranges(ranges):
     return merged
 
 
+def build_lookup(merged):
+    """
+    Split merged (sorted, disjoint) ranges into start and end lists
+    for binary search.
+    """
+    starts = [start for start, _ in merged]
+    ends = [end for _, end in merged]
+    return starts, ends
+
+
+def is_fresh(value, starts, ends):
+    # Last range starting at or before value is the only candidate
+    i = bisect_right(starts, value) - 1
+    return i >= 0 and value <= ends[i]
+
+
 def is_in_any_range(value, ranges):
     for start, end in ranges:
         if start <= value <= end:
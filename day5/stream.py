@@ -0,0 +1,73 @@
+import sys
+
+import numpy as np
+
+from part2 import merge_ranges
+
+CHUNK_BYTES = 1 << 22  # ~4 MiB of ID text per chunk
+
+
+def read_ranges(f):
+    """
+    Read "start-end" lines up to the blank separator line, merged.
+    Returns (starts, ends) int64 arrays of the sorted, disjoint ranges.
+    """
+    ranges = []
+    for line in f:
+        line = line.strip()
+        if not line:
+            break
+        start, end = map(int, line.split(b"-"))
+        ranges.append((start, end))
+
+    # One sort and merge for the whole section; adjacent ranges are joined
+    merged = merge_ranges(ranges)
+    starts = np.array([start for start, _ in merged], dtype=np.int64)
+    ends = np.array([end for _, end in merged], dtype=np.int64)
+    return starts, ends
+
+
+def iter_id_chunks(f, chunk_bytes=CHUNK_BYTES):
+    """Yield int64 arrays of IDs for newline-aligned chunks of the rest of f."""
+    while True:
+        chunk = f.read(chunk_bytes)
+        if not chunk:
+            return
+        if not chunk.endswith(b"\n"):
+            chunk += f.readline()
+        if chunk.strip():
+            yield np.fromstring(chunk, dtype=np.int64, sep=" ")
+
+
+def count_fresh_chunk(ids, starts, ends) -> int:
+    """How many IDs fall in one of the sorted, disjoint [starts, ends] ranges."""
+    if len(starts) == 0:
+        return 0
+    i = np.searchsorted(starts, ids, side="right") - 1
+    fresh = (i >= 0) & (ids <= ends[np.maximum(i, 0)])
+    return int(np.count_nonzero(fresh))
+
+
+def count_fresh_stream(f, chunk_bytes=CHUNK_BYTES):
+    """Return (fresh available IDs, total fresh IDs) for a binary stream."""
+    starts, ends = read_ranges(f)
+
+    fresh_count = 0
+    for ids in iter_id_chunks(f, chunk_bytes):
+        fresh_count += count_fresh_chunk(ids, starts, ends)
+
+    # Summed as Python ints; the total can pass the int64 range
+    covered = sum((ends - starts + 1).tolist())
+    return fresh_count, covered
+
+
+def main():
+    fresh_count, covered = count_fresh_stream(sys.stdin.buffer)
+    print(fresh_count)
+    print(covered)
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 stream.py < day5-input.txt
@@ -0,0 +1,58 @@
+import heapq
+import os
+import time
+from multiprocessing import Pool
+
+
+def product_tree(numbers) -> int:
+    """
+    Multiply numbers pairwise, round by round, so the operands of each
+    multiplication stay about the same size. A left fold instead drags
+    one ever-growing product through every step.
+    """
+    numbers = list(numbers)
+    if not numbers:
+        return 1
+
+    while len(numbers) > 1:
+        paired = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+
+    return numbers[0]
+
+
+def evaluate_problem(op: str, numbers) -> int:
+    if op == "+":
+        return sum(numbers)
+    return product_tree(numbers)
+
+
+def timed_problem(job):
+    """Evaluate one (index, op, numbers) job; returns (index, result, seconds)."""
+    index, op, numbers = job
+    start = time.perf_counter()
+    result = evaluate_problem(op, numbers)
+    return index, result, time.perf_counter() - start
+
+
+def evaluate_blocks(problems, workers=None, slowest=5):
+    """
+    Evaluate independent (op, numbers) problem blocks on a process pool.
+    Returns (grand total, [(seconds, block index), ...] for the slowest
+    blocks, slowest first).
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [(i, op, numbers) for i, (op, numbers) in enumerate(problems)]
+
+    if workers == 1 or len(jobs) < 2:
+        results = [timed_problem(job) for job in jobs]
+    else:
+        with Pool(workers) as pool:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            results = pool.map(timed_problem, jobs, chunksize)
+
+    total = sum(result for _, result, _ in results)
+    timings = heapq.nlargest(slowest, ((seconds, i) for i, _, seconds in results))
+    return total, timings
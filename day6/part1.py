@@ -1,13 +1,13 @@
 import sys
 import re
-from functools import reduce
-from operator import add, mul
 
-def main():
-    lines = [line.rstrip("\n") for line in sys.stdin.readlines()]
+from evaluate import evaluate_blocks
+from worksheet import load_worksheet, problem_spans
+
+def parse_problems(lines):
+    """Return the worksheet's (op, numbers) problem blocks, left to right."""
     if not lines:
-        print(0)
-        return
+        return []
 
     # Normalize row lengths by padding with spaces
     width = max(len(line) for line in lines)
@@ -16,23 +16,10 @@ def main():
     height = len(grid)
     last_row = height - 1  # operator row
 
-    problem_columns = []
-    col = 0
-
-    # Identify contiguous column blocks (problems)
-    while col < width:
-        if all(grid[r][col] == " " for r in range(height)):
-            col += 1
-            continue
-
-        # Start of a block
-        start = col
-        while col < width and not all(grid[r][col] == " " for r in range(height)):
-            col += 1
-        end = col  # one past the last column of the block
-        problem_columns.append((start, end))
+    # Identify contiguous column blocks (problems) in one pass
+    problem_columns = problem_spans(load_worksheet(lines))
 
-    total = 0
+    problems = []
 
     for start, end in problem_columns:
         # Extract operator (exactly one non-space expected)
@@ -53,14 +40,16 @@ def main():
         if not numbers:
             raise ValueError(f"No numbers found in block {start}-{end}")
 
-        # Compute result for this problem
-        if op == "+":
-            result = sum(numbers)
-        else:  # op == "*"
-            result = reduce(mul, numbers, 1)
+        problems.append((op, numbers))
 
-        total += result
+    return problems
+
+
+def main():
+    lines = [line.rstrip("\n") for line in sys.stdin.readlines()]
 
+    # Blocks are independent; evaluate them in parallel
+    total, _ = evaluate_blocks(parse_problems(lines))
     print(total)
 
 if __name__ == "__main__":
@@ -1,13 +1,15 @@
 import sys
-from functools import reduce
-import operator
 
+from evaluate import evaluate_blocks
+from worksheet import MappedWorksheet, load_worksheet, problem_spans, spans_from_blank
 
-def main():
-    lines = [line.rstrip("\n") for line in sys.stdin.readlines()]
+ZERO, NINE = ord("0"), ord("9")
+
+
+def parse_problems(lines):
+    """Return the worksheet's (op, numbers) problem blocks, right to left."""
     if not lines:
-        print(0)
-        return
+        return []
 
     # Pad all lines to the same width
     width = max(len(line) for line in lines)
@@ -16,28 +18,11 @@ def main():
     height = len(grid)
     last_row = height - 1
 
-    def is_blank_col(c: int) -> bool:
-        """Return True if column c is all spaces."""
-        for r in range(height):
-            if grid[r][c] != " ":
-                return False
-        return True
-
-    total = 0
-    c = width - 1  # start from rightmost column
-
-    while c >= 0:
-        # Skip blank separator columns
-        if is_blank_col(c):
-            c -= 1
-            continue
-
-        # We just hit the RIGHT edge of a problem.
-        right = c
-        left = c
-        # Extend leftwards until we hit a blank column or the grid edge.
-        while left - 1 >= 0 and not is_blank_col(left - 1):
-            left -= 1
+    problems = []
+
+    # Problem blocks from the shared one-pass column scan, taken right to left
+    for left, end in reversed(problem_spans(load_worksheet(lines))):
+        right = end - 1
 
         # Columns [left .. right] (inclusive) are this problem.
         # We'll process them from right to left, since cephalopod math is RTL.
@@ -70,17 +55,55 @@ def main():
                 # By puzzle spec, there should always be some digit; if not, treat as error.
                 raise ValueError(f"No digits found in column {col} of a problem.")
 
-        # Apply the operator over all numbers in this problem
-        if op == "+":
-            result = sum(numbers)
-        else:  # op == "*"
-            result = reduce(operator.mul, numbers, 1)
+        problems.append((op, numbers))
+
+    return problems
+
+
+def column_number(column) -> int:
+    """Read the digits of a byte column top to bottom as one number."""
+    digits = column[(column >= ZERO) & (column <= NINE)]
+    if len(digits) == 0:
+        raise ValueError("No digits found in a problem column.")
+    return int(digits.tobytes())
+
 
-        total += result
+def parse_problems_mapped(path):
+    """Same blocks as parse_problems, reading columns straight from the mapped file."""
+    ws = MappedWorksheet(path)
+    if ws.height == 0:
+        return []
 
-        # Next problem lies further left, past this block
-        c = left - 1
+    last_row = ws.height - 1
+    operators = ws.row(last_row)
+    problems = []
 
+    for left, end in reversed(spans_from_blank(ws.blank_columns())):
+        # Find the operator (exactly one + or * on the bottom row)
+        ops = [chr(ch) for ch in operators[left:end].tobytes() if ch in b"+*"]
+        if len(ops) > 1:
+            raise ValueError("Multiple operators found in a single problem.")
+        if not ops:
+            raise ValueError("No operator found in a problem block.")
+
+        # One number per column, right to left, excluding the operator row
+        numbers = [column_number(ws.column(col)[:last_row])
+                   for col in range(end - 1, left - 1, -1)]
+
+        problems.append((ops[0], numbers))
+
+    return problems
+
+
+def main():
+    if len(sys.argv) > 1:
+        problems = parse_problems_mapped(sys.argv[1])
+    else:
+        lines = [line.rstrip("\n") for line in sys.stdin.readlines()]
+        problems = parse_problems(lines)
+
+    # Blocks are independent; evaluate them in parallel
+    total, _ = evaluate_blocks(problems)
     print(total)
 
 
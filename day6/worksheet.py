@@ -0,0 +1,105 @@
+import mmap
+import os
+
+import numpy as np
+
+SPACE = ord(" ")
+
+
+def load_worksheet(lines) -> np.ndarray:
+    """
+    Pack worksheet lines (str or bytes, no newlines) into a uint8 byte
+    matrix, padding short rows with spaces.
+    """
+    lines = [line.encode() if isinstance(line, str) else line for line in lines]
+    width = max((len(line) for line in lines), default=0)
+
+    mat = np.full((len(lines), width), SPACE, dtype=np.uint8)
+    for r, line in enumerate(lines):
+        mat[r, :len(line)] = np.frombuffer(line, dtype=np.uint8)
+    return mat
+
+
+def blank_columns(mat: np.ndarray) -> np.ndarray:
+    """Boolean per column: True where every row holds a space."""
+    return (mat == SPACE).all(axis=0)
+
+
+def problem_spans(mat: np.ndarray):
+    """
+    Column spans [start, end) of the problem blocks, left to right.
+    A block is a maximal run of non-blank columns.
+    """
+    return spans_from_blank(blank_columns(mat))
+
+
+def spans_from_blank(blank: np.ndarray):
+    """Problem block spans [start, end) from a per-column blank bitmap."""
+    occupied = ~blank
+
+    # Edges are where occupancy flips; pad so runs touching the sides close
+    flips = np.diff(np.concatenate(([False], occupied, [False])).view(np.int8))
+    edges = np.flatnonzero(flips)
+    return [(int(start), int(end)) for start, end in zip(edges[0::2], edges[1::2])]
+
+
+# ---------- Memory-mapped, column-addressable worksheet ----------
+class MappedWorksheet:
+    """
+    Read-only worksheet backed by a memory-mapped file. Short rows are
+    padded with spaces virtually; nothing is copied with ljust.
+    """
+
+    def __init__(self, path):
+        starts, ends = [], []
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self.buf = np.zeros(0, dtype=np.uint8)
+            else:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self.buf = np.frombuffer(mm, dtype=np.uint8)
+
+                # Row offsets and lengths; rows are few, columns are many
+                pos = 0
+                while pos < len(mm):
+                    end = mm.find(b"\n", pos)
+                    end = len(mm) if end < 0 else end
+                    starts.append(pos)
+                    ends.append(end)
+                    pos = end + 1
+
+        self.offsets = np.array(starts, dtype=np.int64)
+        self.lengths = np.array(ends, dtype=np.int64) - self.offsets
+        self.height = len(starts)
+        self.width = int(self.lengths.max()) if self.height else 0
+
+        # Equal-width rows: the whole file is a (height, width) strided view
+        # and every column is a zero-copy view down it
+        self.grid = None
+        if self.height and (self.lengths == self.width).all():
+            self.grid = np.ndarray((self.height, self.width), dtype=np.uint8,
+                                   buffer=self.buf, strides=(self.width + 1, 1))
+
+    def row(self, r) -> np.ndarray:
+        """Bytes of row r without padding (a view into the file)."""
+        return self.buf[self.offsets[r]:self.offsets[r] + self.lengths[r]]
+
+    def column(self, c) -> np.ndarray:
+        """Bytes of column c, top to bottom, with virtual space padding."""
+        if self.grid is not None:
+            return self.grid[:, c]
+
+        col = np.full(self.height, SPACE, dtype=np.uint8)
+        inside = c < self.lengths
+        col[inside] = self.buf[self.offsets[inside] + c]
+        return col
+
+    def blank_columns(self) -> np.ndarray:
+        if self.grid is not None:
+            return blank_columns(self.grid)
+
+        blank = np.ones(self.width, dtype=bool)
+        for r in range(self.height):
+            row = self.row(r)
+            blank[:len(row)] &= row == SPACE
+        return blank
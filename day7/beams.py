@@ -0,0 +1,124 @@
+import sys
+
+# Byte translation: '^' -> '1', every other byte -> '0'
+SPLITTER_BITS = bytes(b"1"[0] if b == ord("^") else b"0"[0] for b in range(256))
+
+
+def splitter_mask(row: str) -> int:
+    """Bit c is set when column c of the row holds a splitter."""
+    bits = row.encode()[::-1].translate(SPLITTER_BITS)
+    return int(bits, 2) if bits else 0
+
+
+def iter_rows(path):
+    """Stream the manifold's rows from a file, one at a time."""
+    with open(path) as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def grid_width(path) -> int:
+    """Widest row in the file (rows are padded with '.' to this width)."""
+    with open(path) as f:
+        return max((len(line.rstrip("\n")) for line in f), default=0)
+
+
+def beam_rows(rows):
+    """
+    Skip ahead to the row where the beam starts (just below S).
+    Returns (S column, iterator over the remaining rows), or (None, None)
+    if there is no S or no row below it.
+    """
+    rows = iter(rows)
+    for row in rows:
+        s_col = row.find("S")
+        if s_col >= 0:
+            # The beam starts on the next row; that row itself is never checked
+            if next(rows, None) is None:
+                return s_col, None
+            return s_col, rows
+    return None, None
+
+
+def count_splits(rows, cols) -> int:
+    """
+    Part 1: number of splitters a beam reaches.
+
+    The active beam columns of the current row are a bitmask. A beam over
+    a splitter is replaced by beams on the same row to its left and right,
+    which may land over further splitters, so each row spreads until
+    nothing new is spawned. Beams not over a splitter fall to the next row.
+    """
+    s_col, rows = beam_rows(rows)
+    if rows is None:
+        return 0
+
+    full = (1 << cols) - 1
+    active = 1 << s_col
+    split_count = 0
+
+    for row in rows:
+        splitters = splitter_mask(row)
+
+        visited = active
+        frontier = active
+        while frontier:
+            hits = frontier & splitters
+            split_count += hits.bit_count()
+
+            spawned = ((hits << 1) | (hits >> 1)) & full & ~visited
+            visited |= spawned
+            frontier = spawned
+
+        active = visited & ~splitters
+        if not active:
+            break
+
+    return split_count
+
+
+def count_timelines(rows, cols) -> int:
+    """
+    Part 2: number of timelines (leaves) once every beam has left the grid.
+
+    Only the current row's counts are kept (column -> number of timelines
+    there). A splitter below a column sends its timelines one column left
+    and one column right on the next row; off the sides they end as leaves.
+    """
+    s_col, rows = beam_rows(rows)
+    if s_col is None:
+        return 0
+    if rows is None:
+        return 1  # S is on the last row
+
+    counts = {s_col: 1}
+    leaf_count = 0
+
+    for row in rows:
+        below = {}
+        for c, ways in counts.items():
+            if c < len(row) and row[c] == "^":
+                for nc in (c - 1, c + 1):
+                    if 0 <= nc < cols:
+                        below[nc] = below.get(nc, 0) + ways
+                    else:
+                        leaf_count += ways
+            else:
+                below[c] = below.get(c, 0) + ways
+        counts = below
+
+    # Everything still falling exits the bottom
+    return leaf_count + sum(counts.values())
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "day7-input.txt"
+    cols = grid_width(path)
+    print(count_splits(iter_rows(path), cols))
+    print(count_timelines(iter_rows(path), cols))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 beams.py [day7-input.txt]
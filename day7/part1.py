@@ -1,71 +1,28 @@
 import sys
 
+from beams import count_splits, grid_width, iter_rows
+
 def main():
-    grid = [list(line.rstrip("\n")) for line in sys.stdin.readlines()]
-    if not grid:
-        print(0)
+    if len(sys.argv) > 1:
+        # From a file: one pass for the width, then stream the rows, so
+        # only O(cols) state is held however tall the manifold is
+        path = sys.argv[1]
+        print(count_splits(iter_rows(path), grid_width(path)))
         return
 
-    rows = len(grid)
-    cols = max(len(row) for row in grid)
-
-    # Normalize width
-    for r in range(rows):
-        if len(grid[r]) < cols:
-            grid[r] += ['.'] * (cols - len(grid[r]))
-
-    # Find S
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] == 'S':
-                s_row, s_col = r, c
-                break
-
-    # Beam starts below S
-    beams = []
-    if s_row + 1 < rows:
-        beams.append((s_row + 1, s_col))
-
-    visited = set()      # <<< CRUCIAL FIX
-    split_count = 0
-
-    while beams:
-        new_beams = []
-        for (r, c) in beams:
-
-            # Skip if we've seen this beam position before
-            if (r, c) in visited:
-                continue
-            visited.add((r, c))
-
-            nr = r + 1  # move DOWN
-
-            if nr >= rows:
-                continue  # off-grid
-
-            cell = grid[nr][c]
-
-            if cell == '.':
-                new_beams.append((nr, c))
-
-            elif cell == '^':
-                split_count += 1
-
-                # Left beam at SAME ROW as splitter entry
-                if c - 1 >= 0:
-                    new_beams.append((r, c - 1))
-
-                # Right beam at SAME ROW as splitter entry
-                if c + 1 < cols:
-                    new_beams.append((r, c + 1))
-
-            else:
-                new_beams.append((nr, c))
+    # stdin can only be read once, so its rows are kept to find the width
+    rows = [line.rstrip("\n") for line in sys.stdin]
+    if not rows:
+        print(0)
+        return
 
-        beams = new_beams
+    # Rows shorter than the widest one behave as if padded with '.'
+    cols = max(len(row) for row in rows)
 
-    print(split_count)
+    print(count_splits(rows, cols))
 
 
 if __name__ == "__main__":
     main()
+
+# To run: python3 part1.py < day7-input.txt  (or: python3 part1.py day7-input.txt)
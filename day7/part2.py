@@ -1,75 +1,37 @@
 import sys
 
-def main():
-    grid = [list(line.rstrip("\n")) for line in sys.stdin.readlines()]
-    if not grid:
-        print(0)
-        return
-
-    rows = len(grid)
-    cols = max(len(row) for row in grid)
+import beams
+import vector
 
-    # Normalize row widths
-    for r in range(rows):
-        if len(grid[r]) < cols:
-            grid[r] += ['.'] * (cols - len(grid[r]))
+WIDE_COLS = 512  # from this width on, NumPy row propagation wins
 
-    # Locate S
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] == 'S':
-                s_row, s_col = r, c
-                break
-        else:
-            continue
-        break
+def count_timelines(rows, cols) -> int:
+    if cols >= WIDE_COLS:
+        return vector.count_timelines(rows, cols)
+    return beams.count_timelines(rows, cols)
 
-    # dp[r][c] = number of timelines currently at (r, c)
-    dp = [[0] * cols for _ in range(rows)]
 
-    start_r = s_row + 1
-    if start_r >= rows:
-        print(1)
+def main():
+    if len(sys.argv) > 1:
+        # From a file: one pass for the width, then stream the rows, so
+        # only O(cols) state is held however tall the manifold is
+        path = sys.argv[1]
+        print(count_timelines(beams.iter_rows(path), beams.grid_width(path)))
         return
 
-    dp[start_r][s_col] = 1
-    leaf_count = 0
-
-    # Process each row top → bottom
-    for r in range(start_r, rows):
-        for c in range(cols):
-            ways = dp[r][c]
-            if ways == 0:
-                continue
-
-            nr = r + 1
-
-            # Exiting bottom → leaf timelines
-            if nr >= rows:
-                leaf_count += ways
-                continue
-
-            cell_below = grid[nr][c]
-
-            if cell_below == "^":
-                # Split left
-                if c - 1 >= 0:
-                    dp[nr][c - 1] += ways
-                else:
-                    leaf_count += ways
-
-                # Split right
-                if c + 1 < cols:
-                    dp[nr][c + 1] += ways
-                else:
-                    leaf_count += ways
+    # stdin can only be read once, so its rows are kept to find the width
+    rows = [line.rstrip("\n") for line in sys.stdin]
+    if not rows:
+        print(0)
+        return
 
-            else:
-                # Normal downward fall
-                dp[nr][c] += ways
+    # Rows shorter than the widest one behave as if padded with '.'
+    cols = max(len(row) for row in rows)
 
-    print(leaf_count)
+    print(count_timelines(rows, cols))
 
 
 if __name__ == "__main__":
     main()
+
+# To run: python3 part2.py < day7-input.txt  (or: python3 part2.py day7-input.txt)
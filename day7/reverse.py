@@ -0,0 +1,112 @@
+import mmap
+import os
+import sys
+
+import numpy as np
+
+from beams import grid_width
+
+COUNT_BYTES = 1 << 22  # ~4 MiB of the map copied per newline count
+
+
+def count_newlines(mm, end) -> int:
+    """Newlines in mm[:end], counted in bounded slices of the mapping."""
+    return sum(mm[pos:min(pos + COUNT_BYTES, end)].count(b"\n")
+               for pos in range(0, end, COUNT_BYTES))
+
+
+def iter_rows_reversed(path):
+    """Yield (row index, row) from the bottom of the file up, via mmap."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm) - 1 if mm[-1:] == b"\n" else len(mm)
+            r = count_newlines(mm, end)  # index of the last row
+
+            while True:
+                start = mm.rfind(b"\n", 0, end) + 1
+                yield r, mm[start:end].decode()
+                if start == 0:
+                    return
+                end = start - 1
+                r -= 1
+
+
+def iter_timeline_rows(path, cols):
+    """
+    Reverse DP, bottom row first. Yields (r, row, below) where below[c]
+    is the number of leaf timelines for a timeline at (r + 1, c), i.e.
+    one that has just fallen onto row r + 1. Only one row of counts is
+    kept at a time.
+    """
+    below = None       # counts for row r + 1
+    below_row = None   # text of row r + 1
+
+    for r, row in iter_rows_reversed(path):
+        if below is None:
+            counts = [1] * cols  # bottom row: every timeline exits next
+        else:
+            # Falls keep the count of the cell below; splitters below
+            # add up their left and right branches (1 each off the sides)
+            counts = below[:]
+            c = below_row.find("^")
+            while c >= 0:
+                left = below[c - 1] if c - 1 >= 0 else 1
+                right = below[c + 1] if c + 1 < cols else 1
+                counts[c] = left + right
+                c = below_row.find("^", c + 1)
+
+        yield r, row, below
+        below, below_row = counts, row
+
+
+def entry_timelines(path):
+    """
+    Timeline count for a beam entering just below S's row at every column.
+    Entry c of the result is what part 2 prints if S were at column c.
+    """
+    cols = grid_width(path)
+    entry = None
+
+    # Keep going to the top so the first S in the file wins
+    for r, row, below in iter_timeline_rows(path, cols):
+        if "S" in row:
+            entry = below if below is not None else [1] * cols
+
+    if entry is None:
+        raise ValueError("No S found in the manifold.")
+    return entry
+
+
+def to_table(counts) -> np.ndarray:
+    """
+    Pack big-int counts into a (cols, nbytes) uint8 array of fixed-width
+    little-endian integers, so it can be saved as .npy and memory-mapped.
+    """
+    nbytes = max(1, (max(counts, default=0).bit_length() + 7) // 8)
+    packed = b"".join(count.to_bytes(nbytes, "little") for count in counts)
+    return np.frombuffer(packed, dtype=np.uint8).reshape(len(counts), nbytes)
+
+
+def lookup(table: np.ndarray, c: int) -> int:
+    return int.from_bytes(table[c].tobytes(), "little")
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "day7-input.txt"
+    table = to_table(entry_timelines(path))
+
+    if len(sys.argv) > 2:
+        np.save(sys.argv[2], table)  # reload with np.load(..., mmap_mode="r")
+
+    # Same answer as part 2, for the actual S column
+    with open(path) as f:
+        s_col = next(line.find("S") for line in f if "S" in line)
+    print(lookup(table, s_col))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 reverse.py [day7-input.txt] [table.npy]
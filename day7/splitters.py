@@ -0,0 +1,120 @@
+import heapq
+import sys
+from bisect import bisect_right
+
+# ---------- Splitter index ----------
+class SplitterIndex:
+    """
+    For each column, the sorted rows that hold a splitter, plus where S is.
+    Only splitters are stored, so sparse manifolds stay small.
+    """
+
+    def __init__(self, rows):
+        self.columns = {}  # column -> sorted splitter rows
+        self.s_row = self.s_col = None
+        self.rows = 0
+        self.cols = 0
+
+        for r, row in enumerate(rows):
+            self.rows = r + 1
+            self.cols = max(self.cols, len(row))
+
+            if self.s_row is None:
+                c = row.find("S")
+                if c >= 0:
+                    self.s_row, self.s_col = r, c
+
+            # Rows arrive in order, so each column's list stays sorted
+            c = row.find("^")
+            while c >= 0:
+                self.columns.setdefault(c, []).append(r)
+                c = row.find("^", c + 1)
+
+    def next_splitter(self, r, c):
+        """Row of the first splitter in column c strictly below row r, or None."""
+        splitter_rows = self.columns.get(c)
+        if not splitter_rows:
+            return None
+        i = bisect_right(splitter_rows, r)
+        return splitter_rows[i] if i < len(splitter_rows) else None
+
+
+def count_splits(index: SplitterIndex) -> int:
+    """
+    Part 1: number of splitters a beam reaches. Each beam jumps straight
+    to the next splitter below it; a splitter already hit has already
+    sent its beams on, so it stops there.
+    """
+    if index.s_row is None or index.s_row + 1 >= index.rows:
+        return 0
+
+    hit = set()
+    beams = [(index.s_row + 1, index.s_col)]
+
+    while beams:
+        r, c = beams.pop()
+        s = index.next_splitter(r, c)
+        if s is None or (s, c) in hit:
+            continue
+        hit.add((s, c))
+
+        # New beams start beside the splitter, on the row above it
+        for nc in (c - 1, c + 1):
+            if 0 <= nc < index.cols:
+                beams.append((s - 1, nc))
+
+    return len(hit)
+
+
+def count_timelines(index: SplitterIndex) -> int:
+    """
+    Part 2: number of leaf timelines. Timeline counts are carried from
+    splitter to splitter in row order, so every count reaching a splitter
+    has arrived before it is passed on.
+    """
+    if index.s_row is None:
+        return 0
+    if index.s_row + 1 >= index.rows:
+        return 1  # S is on the last row
+
+    pending = {}  # (splitter row, column) -> timelines arriving there
+    events = []
+    leaf_count = 0
+
+    def send(r, c, ways):
+        nonlocal leaf_count
+        s = index.next_splitter(r, c)
+        if s is None:
+            leaf_count += ways  # falls out of the bottom
+        elif (s, c) in pending:
+            pending[s, c] += ways
+        else:
+            pending[s, c] = ways
+            heapq.heappush(events, (s, c))
+
+    send(index.s_row + 1, index.s_col, 1)
+
+    while events:
+        s, c = heapq.heappop(events)
+        ways = pending.pop((s, c))
+
+        # Split left and right onto the splitter's row
+        for nc in (c - 1, c + 1):
+            if 0 <= nc < index.cols:
+                send(s, nc, ways)
+            else:
+                leaf_count += ways
+
+    return leaf_count
+
+
+def main():
+    index = SplitterIndex(line.rstrip("\n") for line in sys.stdin)
+    print(count_splits(index))
+    print(count_timelines(index))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 splitters.py < day7-input.txt
@@ -0,0 +1,20 @@
+import pytest
+
+import beams
+import vector
+
+WIDTH = 200
+
+
+def alternating_grid(height):
+    """S in the middle, then rows that alternate between empty and all splitters."""
+    rows = ["." * (WIDTH // 2) + "S" + "." * (WIDTH // 2 - 1)]
+    rows += ["^" * WIDTH if r % 2 else "." * WIDTH for r in range(height)]
+    return rows
+
+
+# Around height 126 the row total passes int64 while every cell still fits
+@pytest.mark.parametrize("height", [60, 125, 126, 127, 128, 129, 131, 300])
+def test_total_past_int64(height):
+    rows = alternating_grid(height)
+    assert vector.count_timelines(rows, WIDTH) == beams.count_timelines(rows, WIDTH)
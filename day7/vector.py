@@ -0,0 +1,87 @@
+import sys
+
+import numpy as np
+
+from beams import beam_rows
+
+SPLITTER = ord("^")
+# A cell can receive its own count plus a spill from each side, so one
+# row grows counts by at most 3x; beyond this int64 could overflow
+INT64_SAFE = np.iinfo(np.int64).max // 3
+
+
+def splitter_vector(row: str, width: int) -> np.ndarray:
+    """Boolean splitter mask for a row, padded with False to width."""
+    mask = np.zeros(width, dtype=bool)
+    mask[:len(row)] = np.frombuffer(row.encode(), dtype=np.uint8) == SPLITTER
+    return mask
+
+
+def count_timelines(rows, cols) -> int:
+    """
+    Part 2 with NumPy row propagation. Counts live in an int64 vector
+    until they get close to overflowing, then switch to a Python-int
+    object vector so the exact (exponentially growing) total is kept.
+
+    Beams spread at most one column per side per row, so only the active
+    window [lo, hi] of the vector is touched on each row.
+    """
+    s_col, rows = beam_rows(rows)
+    if s_col is None:
+        return 0
+    if rows is None:
+        return 1  # S is on the last row
+
+    counts = np.zeros(cols, dtype=np.int64)
+    counts[s_col] = 1
+    lo = hi = s_col
+    leaf_count = 0
+
+    for row in rows:
+        part = row[lo:hi + 1]
+        if "^" not in part:
+            continue  # everything falls straight down
+
+        window = counts[lo:hi + 1]
+        if counts.dtype != object and window.max() > INT64_SAFE:
+            counts = counts.astype(object)
+            window = counts[lo:hi + 1]
+
+        splitters = splitter_vector(part, hi - lo + 1)
+        spill = np.where(splitters, window, 0)
+        window[splitters] = 0
+
+        # Shifted adds: each splitter sends its count left and right;
+        # branches off either side of the grid become leaves
+        if lo > 0:
+            counts[lo - 1:hi] += spill
+        else:
+            counts[:hi] += spill[1:]
+            leaf_count += int(spill[0])
+
+        if hi < cols - 1:
+            counts[lo + 1:hi + 2] += spill
+        else:
+            counts[lo + 1:] += spill[:-1]
+            leaf_count += int(spill[-1])
+
+        lo = max(lo - 1, 0)
+        hi = min(hi + 1, cols - 1)
+
+    # Everything still falling exits the bottom. Each cell fits in int64
+    # but their sum may not, so it is taken in Python ints
+    return leaf_count + sum(counts[lo:hi + 1].tolist())
+
+
+def main():
+    rows = [line.rstrip("\n") for line in sys.stdin]
+    if not rows:
+        print(0)
+        return
+    print(count_timelines(rows, max(len(row) for row in rows)))
+
+
+if __name__ == "__main__":
+    main()
+
+# To run: python3 vector.py < day7-input.txt
@@ -0,0 +1,124 @@
+import heapq
+import math
+
+# Neighbor cells to compare with: the cell itself plus half of the 26
+# around it, so every pair of nearby cells is visited exactly once
+FORWARD_CELLS = [(0, 0, 0)] + [
+    (dx, dy, dz)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+]
+
+
+# Shrink the cells while they hold more than this many pairs per pair
+# asked for; a radius that fits holds a few times k pairs in all
+CROWDED_PAIRS = 8
+
+
+def estimate_radius(points, k):
+    """
+    Radius expected to hold about 2k pairs if points were spread evenly
+    over their bounding box: pairs ~ n^2 / 2 * (4/3 pi r^3) / volume.
+    Only a starting point: outliers stretch the box, so the cell size is
+    then fitted to the occupied cells.
+    """
+    volume = 1
+    for axis in zip(*points):
+        volume *= max(max(axis) - min(axis), 1)
+    n = len(points)
+    return (3 * (2 * k) * volume / (2 * math.pi * n * n)) ** (1 / 3)
+
+
+def bucket(points, radius):
+    """Group point indices into cubes of side `radius`."""
+    cells = {}
+    for i, (x, y, z) in enumerate(points):
+        key = (math.floor(x / radius), math.floor(y / radius), math.floor(z / radius))
+        cells.setdefault(key, []).append(i)
+    return cells
+
+
+def cell_pairs(cells):
+    """
+    Pairs of points sharing a cell. Crowded cells dominate it, which is
+    what a too-large radius produces.
+    """
+    return sum(len(members) * (len(members) - 1) // 2 for members in cells.values())
+
+
+def pairs_within(points, cells, radius, k):
+    """
+    Compare only points in nearby cells of side `radius`. Returns (number
+    of pairs with distance <= radius, heap of the k smallest such pairs
+    as (-dist2, -i, -j)).
+    """
+    limit = radius * radius
+    found = 0
+    heap = []  # max-heap on (dist2, i, j) via negation, at most k entries
+
+    for (cx, cy, cz), members in cells.items():
+        for dx, dy, dz in FORWARD_CELLS:
+            others = cells.get((cx + dx, cy + dy, cz + dz))
+            if others is None:
+                continue
+            same_cell = dx == dy == dz == 0
+
+            for a_pos, a in enumerate(members):
+                x1, y1, z1 = points[a]
+                for b in (others[a_pos + 1:] if same_cell else others):
+                    x2, y2, z2 = points[b]
+                    ddx = x1 - x2
+                    ddy = y1 - y2
+                    ddz = z1 - z2
+                    dist2 = ddx*ddx + ddy*ddy + ddz*ddz
+                    if dist2 > limit:
+                        continue
+
+                    found += 1
+                    i, j = (a, b) if a < b else (b, a)
+                    item = (-dist2, -i, -j)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+
+    return found, heap
+
+
+def k_closest_pairs(points, k):
+    """
+    The k closest (dist2, i, j) pairs with i < j, in the same order as
+    sorting every pair by distance (ties by i, then j).
+
+    The cell size starts from the bounding-box estimate and shrinks
+    while the occupied cells are too crowded to scan cheaply, so a few
+    far outliers cannot put every point in one cell. Then the radius
+    grows until at least k pairs lie within it; every pair closer than
+    the k-th has been seen. Memory is O(N + k).
+    """
+    n = len(points)
+    k = min(k, n * (n - 1) // 2)
+    if k == 0:
+        return []
+
+    radius = max(estimate_radius(points, k), 1)
+    too_small = 0  # largest radius known to hold fewer than k pairs
+
+    while True:
+        cells = bucket(points, radius)
+        crowded = cell_pairs(cells)
+        # Dense regions hold ~radius^3 points per cell, so cell pairs scale
+        # about as radius^3: shrink by that much at once, aiming at about
+        # k pairs (at least halving), but not to a radius already ruled out
+        if crowded > CROWDED_PAIRS * k and radius / 2 > max(too_small, 1):
+            scale = min((k / crowded) ** (1 / 3), 0.5)
+            radius = max(radius * scale, too_small * 1.01, 1)
+            continue
+
+        found, heap = pairs_within(points, cells, radius, k)
+        if found >= k:
+            return sorted((-d, -i, -j) for d, i, j in heap)
+        too_small = radius
+        radius *= 2
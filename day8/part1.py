@@ -1,6 +1,8 @@
 import sys
 import math
 
+from nearest import k_closest_pairs
+
 # ---------- Union-Find (Disjoint Set Union) ----------
 class DSU:
     def __init__(self, n):
@@ -37,28 +39,14 @@ for line in sys.stdin:
 
 N = len(points)
 
-# ---------- Build pairwise distances ----------
-pairs = []
-for i in range(N):
-    x1, y1, z1 = points[i]
-    for j in range(i + 1, N):
-        x2, y2, z2 = points[j]
-        dx = x1 - x2
-        dy = y1 - y2
-        dz = z1 - z2
-        dist2 = dx*dx + dy*dy + dz*dz
-        pairs.append((dist2, i, j))
-
-# ---------- Sort all pairs by distance ----------
-pairs.sort(key=lambda x: x[0])
-
-# ---------- Process first 1000 pairs ----------
+# ---------- Find the 1000 closest pairs (sorted by distance) ----------
 K = 1000
+pairs = k_closest_pairs(points, K)
+
+# ---------- Process them ----------
 dsu = DSU(N)
 
-limit = min(K, len(pairs))
-for k in range(limit):
-    _, i, j = pairs[k]
+for _, i, j in pairs:
     dsu.union(i, j)
 
 # ---------- Compute component sizes ----------